@@ -6,10 +6,47 @@ Run this to see how the effort analysis works on your actual files
 
 import os
 import json
+import heapq
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from enhanced_file_analysis import FileEffortAnalyzer
 
+# Extensions the demo looks for, in the order they are reported
+DEMO_EXTENSIONS = ('.mus', '.musx', '.sib', '.3dj', '.3dz', '.3da', '.prod', '.musicxml')
+DEMO_EXTENSION_SET = frozenset(DEMO_EXTENSIONS)
+
+# Directory names never worth descending into; app bundles are skipped too
+SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'Library'})
+SKIP_DIR_SUFFIXES = ('.app', '.bundle', '.framework')
+
+# How many directory levels below each search root to descend; override
+# with EFFORT_DEMO_MAX_DEPTH
+DEFAULT_MAX_SEARCH_DEPTH = 6
+
+def _find_creative_files(root, found, max_depth, depth=0):
+    """Collect matching files under root in a single scandir pass"""
+    if depth > max_depth:
+        return
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if (not name.startswith('.') and name not in SKIP_DIRS
+                            and not name.endswith(SKIP_DIR_SUFFIXES)):
+                        _find_creative_files(entry.path, found, max_depth, depth + 1)
+                elif os.path.splitext(name)[1].lower() in DEMO_EXTENSION_SET:
+                    found.append(entry.path)
+            except OSError:
+                continue
+
 def demo_effort_analysis():
     """Demonstrate effort analysis on user's actual files"""
     
@@ -20,6 +57,11 @@ def demo_effort_analysis():
     # Initialize analyzer
     analyzer = FileEffortAnalyzer()
     
+    try:
+        max_depth = int(os.environ.get('EFFORT_DEMO_MAX_DEPTH', DEFAULT_MAX_SEARCH_DEPTH))
+    except ValueError:
+        max_depth = DEFAULT_MAX_SEARCH_DEPTH
+    
     # Find music and drill files in common locations
     home = Path.home()
     search_paths = [
@@ -30,22 +72,26 @@ def demo_effort_analysis():
         Path("/Applications"),  # Sometimes sample files are here
     ]
     
-    music_files = []
-    extensions = ['.mus', '.musx', '.sib', '.3dj', '.3dz', '.3da', '.prod', '.musicxml']
+    # Search roots can overlap (symlinked or cloud-synced folders), so files
+    # are keyed by their real path to avoid analyzing the same file twice
+    music_files = set()
     
     print("🔍 Searching for music and drill design files...")
     for search_path in search_paths:
-        if search_path.exists():
-            for ext in extensions:
-                files = list(search_path.rglob(f"*{ext}"))
-                music_files.extend(files)
-                if files:
-                    print(f"   Found {len(files)} {ext} files in {search_path}")
+        if search_path.is_dir():
+            found = []
+            _find_creative_files(search_path, found, max_depth)
+            music_files.update(os.path.realpath(f) for f in found)
+            counts = Counter(os.path.splitext(f)[1].lower() for f in found)
+            for ext in DEMO_EXTENSIONS:
+                if counts[ext]:
+                    print(f"   Found {counts[ext]} {ext} files in {search_path}")
     
     if not music_files:
         print("❌ No music notation or drill design files found.")
         print("   Try creating some test files or check other directories.")
         return
+    music_files = sorted(music_files)
     
     print(f"\n✅ Found {len(music_files)} total creative files")
     print("\n" + "="*60)
@@ -54,30 +100,53 @@ def demo_effort_analysis():
     print("\n📊 INDIVIDUAL FILE ANALYSIS")
     print("-" * 40)
     
-    analyzed_files = []
-    for i, filepath in enumerate(music_files[:10]):  # Analyze first 10 files
+    # Analysis is stat-bound, so overlap the syscalls on a thread pool and
+    # print the results afterwards in file order
+    sample_files = [str(f) for f in music_files[:10]]  # Analyze first 10 files
+    
+    def analyze_or_error(filepath):
+        # Hand a failure back as the result so one bad file is reported
+        # below instead of aborting the whole section
         try:
-            analysis = analyzer.analyze_single_file(str(filepath))
-            analyzed_files.append(analysis)
-            
-            print(f"\n{i+1}. {analysis['filename']}")
-            print(f"   Type: {analysis['file_type']} ({analysis['extension']})")
-            print(f"   Size: {analysis['size_kb']} KB")
-            print(f"   Created: {analysis['created'][:10]}")
-            print(f"   Modified: {analysis['modified'][:10]}")
-            print(f"   Work span: {analysis['work_span_days']} days")
-            print(f"   📅 Estimated hours: {analysis['estimated_hours']}")
-            
-            # Show reasoning
-            if analysis['size_kb'] > 1000:
-                print("     • Large file (+complexity)")
-            if analysis['work_span_days'] > 7:
-                print("     • Extended work period (+iterations)")
-            if analysis['file_type'] in ['pyware_project', 'finale_current']:
-                print("     • High-complexity file type")
-                
+            return analyzer.analyze_single_file(filepath)
         except Exception as e:
-            print(f"   Error analyzing {filepath}: {e}")
+            return e
+    
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        sample_analyses = list(executor.map(analyze_or_error, sample_files))
+    
+    # Report lines are collected and written once per section
+    report = []
+    analyzed_files = []
+    for i, (filepath, analysis) in enumerate(zip(sample_files, sample_analyses)):
+        if isinstance(analysis, Exception):
+            report.append(f"   Error analyzing {filepath}: {analysis}")
+            continue
+        if 'error' in analysis:
+            report.append(f"   Error analyzing {filepath}: {analysis['error']}")
+            continue
+        analyzed_files.append(analysis)
+        
+        block = [
+            f"\n{i+1}. {analysis['filename']}",
+            f"   Type: {analysis['file_type']} ({analysis['extension']})",
+            f"   Size: {analysis['size_kb']} KB",
+            f"   Created: {analysis['created'][:10]}",
+            f"   Modified: {analysis['modified'][:10]}",
+            f"   Work span: {analysis['work_span_days']} days",
+            f"   📅 Estimated hours: {analysis['estimated_hours']}",
+        ]
+        
+        # Show reasoning
+        if analysis['size_kb'] > 1000:
+            block.append("     • Large file (+complexity)")
+        if analysis['work_span_days'] > 7:
+            block.append("     • Extended work period (+iterations)")
+        if analysis['file_type'] in ['pyware_project', 'finale_current']:
+            block.append("     • High-complexity file type")
+        report.extend(block)
+    if report:
+        sys.stdout.write("\n".join(report) + "\n")
     
     # Project analysis (version detection)
     print(f"\n" + "="*60)
@@ -89,20 +158,25 @@ def demo_effort_analysis():
         version_analysis = analyzer.analyze_file_versions(file_paths)
         
         if version_analysis:
-            print(f"\nDetected {len(version_analysis)} projects with multiple versions:")
+            report = [f"\nDetected {len(version_analysis)} projects with multiple versions:"]
             
-            for i, (project_name, analysis) in enumerate(version_analysis.items()[:5]):
-                print(f"\n{i+1}. Project: {project_name}")
-                print(f"   📁 Files: {analysis['file_count']}")
-                print(f"   📅 Span: {analysis['span_days']} days")
-                print(f"   📈 Size growth: {analysis['size_growth_kb']} KB")
-                print(f"   🔧 Work sessions: {analysis['work_sessions']}")
-                print(f"   ⏱️  Estimated hours: {analysis['estimated_hours']}")
-                print(f"   📂 Sample files:")
+            top_projects = heapq.nlargest(5, version_analysis.items(),
+                                          key=lambda kv: kv[1].get('estimated_hours', 0))
+            for i, (project_name, analysis) in enumerate(top_projects):
+                report.extend([
+                    f"\n{i+1}. Project: {project_name}",
+                    f"   📁 Files: {analysis['file_count']}",
+                    f"   📅 Span: {analysis['span_days']} days",
+                    f"   📈 Size growth: {analysis['size_growth_kb']} KB",
+                    f"   🔧 Work sessions: {analysis['work_sessions']}",
+                    f"   ⏱️  Estimated hours: {analysis['estimated_hours']}",
+                    f"   📂 Sample files:",
+                ])
                 for filepath in analysis['files'][:3]:
-                    print(f"      • {os.path.basename(filepath)}")
+                    report.append(f"      • {os.path.basename(filepath)}")
                 if len(analysis['files']) > 3:
-                    print(f"      ... and {len(analysis['files']) - 3} more")
+                    report.append(f"      ... and {len(analysis['files']) - 3} more")
+            sys.stdout.write("\n".join(report) + "\n")
         else:
             print("No multi-version projects detected.")
             print("(This happens when files have very different names)")
@@ -220,9 +294,11 @@ def create_sample_analysis():
     for i, (filename, description, size) in enumerate(files_to_create):
         filepath = demo_dir / filename
         
-        # Create file with content
-        with open(filepath, 'w') as f:
-            f.write(f"# {description}\n" + "Sample content\n" * (size // 20))
+        # Write a short header and extend the file to the target size; the
+        # analyzer only looks at metadata, so the padding can stay sparse
+        with open(filepath, 'wb') as f:
+            f.write(f"# {description}\n".encode())
+            f.truncate(size)
         
         # Set different modification times to simulate work progression
         mod_time = base_time + (i * 3 * 24 * 3600)  # 3 days apart
@@ -232,8 +308,6 @@ def create_sample_analysis():
     print("   Run the analysis again to see these files in action!")
 
 if __name__ == "__main__":
-    import sys
-    
     if len(sys.argv) > 1 and sys.argv[1] == "--create-samples":
         create_sample_analysis()
     else:
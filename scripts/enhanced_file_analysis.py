@@ -6,12 +6,134 @@ Add this to your existing scripts/ folder
 
 import os
 import json
-import hashlib
-from datetime import datetime, timedelta
+import heapq
+from bisect import bisect_left
+from datetime import datetime
 from pathlib import Path
-from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 
+try:
+    import numpy as np
+except ModuleNotFoundError:  # numpy is an optional extra
+    np = None
+
+try:
+    import orjson
+except ModuleNotFoundError:  # stdlib json fallback
+    orjson = None
+
+# Below this many saves the plain loop beats numpy's call overhead; the
+# two measured even at about 200 timestamps
+NUMPY_MIN_TIMESTAMPS = 256
+
+# The stat prefetch is I/O-bound, so threads overlap the syscall latency
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Filename metadata patterns; these run case-sensitively against the
+# lowercased filename when it is ASCII (see _match_fields)
+# Common Pyware naming patterns
+PYWARE_PATTERNS = [
+    ('show_name', re.compile(r'([a-z\s]+)[\d_-]')),
+    ('movement', re.compile(r'(mvmt?\s?\d+|movement\s?\d+)')),
+    ('version', re.compile(r'(v\d+|version\s?\d+)')),
+    ('date', re.compile(r'(\d{4}[-_]\d{2}[-_]\d{2})')),
+]
+
+FINALE_PATTERNS = [
+    ('piece_title', re.compile(r'^([^_\d]+)')),
+    ('movement', re.compile(r'(mvmt?\s?\d+|movement\s?\d+)')),
+    ('version', re.compile(r'(v\d+|version\s?\d+)')),
+    ('instrument', re.compile(r'(score|parts?|piano|vocal)')),
+    ('date', re.compile(r'(\d{4}[-_]\d{2}[-_]\d{2})')),
+]
+
+# Case-insensitive copies for non-ASCII filenames
+IGNORECASE_PATTERNS = {
+    pattern: re.compile(pattern.pattern, re.IGNORECASE)
+    for _, pattern in PYWARE_PATTERNS + FINALE_PATTERNS
+}
+
+# Common version indicators stripped when grouping files into projects
+BASE_NAME_STRIPPERS = [
+    re.compile(r'_v\d+$', re.IGNORECASE),
+    re.compile(r'_version_?\d+$', re.IGNORECASE),
+    re.compile(r'_\d{4}[-_]\d{2}[-_]\d{2}$', re.IGNORECASE),
+    re.compile(r'_copy$', re.IGNORECASE),
+    re.compile(r'_final$', re.IGNORECASE),
+    re.compile(r'_draft$', re.IGNORECASE),
+    re.compile(r'_backup$', re.IGNORECASE),
+    re.compile(r'\s+\(\d+\)$', re.IGNORECASE),  # (1), (2), etc from duplicates
+]
+
+def _match_fields(patterns, filename, metadata):
+    """Add each pattern's first match in filename to metadata, keeping case"""
+    if not filename.isascii():
+        # Letters such as 'ſ' or 'İ' fold differently under lower() than
+        # under re.IGNORECASE, so search the original name case-insensitively
+        for key, pattern in patterns:
+            match = IGNORECASE_PATTERNS[pattern].search(filename)
+            if match:
+                metadata[key] = match.group(1)
+        return metadata
+    
+    # ASCII lowercasing maps one character to one, so spans found in the
+    # lowercased name slice the original
+    lowered = filename.lower()
+    for key, pattern in patterns:
+        match = pattern.search(lowered)
+        if match:
+            start, end = match.span(1)
+            metadata[key] = filename[start:end]
+    
+    return metadata
+
+@lru_cache(maxsize=4096)
+def _project_base_name(filename):
+    """Strip extension and version indicators from a filename (memoized)"""
+    name = os.path.splitext(filename)[0]
+    
+    # Remove common version indicators
+    for pattern in BASE_NAME_STRIPPERS:
+        name = pattern.sub('', name)
+    
+    return name.strip()
+
+def _stat_or_none(filepath):
+    """os.stat that returns None for missing/unreadable files"""
+    try:
+        return os.stat(filepath)
+    except OSError:
+        return None
+
+def _dumps(obj):
+    """Indented JSON bytes for the report files, via orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Base effort by file type
+EFFORT_MULTIPLIERS = {
+    'pyware_project': 8.0,     # Drill design is time-intensive
+    'pyware_compressed': 12.0,  # Finalized shows = even more work
+    'finale_current': 6.0,     # Music composition/arrangement  
+    'finale_legacy': 6.0,
+    'sibelius': 6.0,
+    'musicxml': 2.0,           # Usually exports/imports
+    'document': 2.0,
+    'presentation': 4.0,
+    'spreadsheet': 3.0
+}
+
+# Larger files = more complex: > 500KB, > 1MB, > 5MB
+SIZE_KB_THRESHOLDS = [500, 1000, 5000]
+SIZE_MULTIPLIERS = [1.0, 1.2, 1.5, 2.0]
+
+# Longer span = more iterations: > 1 day, > 1 week, > 1 month
+SPAN_DAY_THRESHOLDS = [1, 7, 30]
+SPAN_MULTIPLIERS = [1.0, 1.1, 1.3, 1.8]
+
 class FileEffortAnalyzer:
     """Analyze actual file effort based on filesystem metadata"""
     
@@ -59,67 +181,37 @@ class FileEffortAnalyzer:
             'presentation': 20,
             'spreadsheet': 15
         }
+        
+        # os.stat results shared by the per-file and per-project passes
+        self._stat_cache = {}
 
     def extract_pyware_metadata(self, filepath):
         """Extract metadata from Pyware files (drill design info)"""
-        try:
-            # Pyware files are binary, but we can extract some basic info
-            # from filename patterns and file size progression
-            filename = os.path.basename(filepath)
-            
-            # Common Pyware naming patterns
-            patterns = {
-                'show_name': r'([A-Za-z\s]+)[\d_-]',
-                'movement': r'(mvmt?\s?\d+|movement\s?\d+)',
-                'version': r'(v\d+|version\s?\d+)',
-                'date': r'(\d{4}[-_]\d{2}[-_]\d{2})'
-            }
-            
-            metadata = {'filename': filename, 'type': 'drill_design'}
-            
-            for key, pattern in patterns.items():
-                match = re.search(pattern, filename, re.IGNORECASE)
-                if match:
-                    metadata[key] = match.group(1)
-            
-            return metadata
-        except:
-            return {'filename': os.path.basename(filepath), 'type': 'drill_design'}
+        # Pyware files are binary, but we can extract some basic info
+        # from filename patterns and file size progression
+        filename = os.path.basename(filepath)
+        
+        metadata = {'filename': filename, 'type': 'drill_design'}
+        
+        return _match_fields(PYWARE_PATTERNS, filename, metadata)
 
     def extract_finale_metadata(self, filepath):
         """Extract metadata from Finale files"""
-        try:
-            # For now, extract from filename patterns
-            # Could be enhanced to read actual Finale metadata
-            filename = os.path.basename(filepath)
-            
-            patterns = {
-                'piece_title': r'^([^_\d]+)',
-                'movement': r'(mvmt?\s?\d+|movement\s?\d+)',
-                'version': r'(v\d+|version\s?\d+)',
-                'instrument': r'(score|parts?|piano|vocal)',
-                'date': r'(\d{4}[-_]\d{2}[-_]\d{2})'
-            }
-            
-            metadata = {'filename': filename, 'type': 'musical_score'}
-            
-            for key, pattern in patterns.items():
-                match = re.search(pattern, filename, re.IGNORECASE)
-                if match:
-                    metadata[key] = match.group(1)
-            
-            return metadata
-        except:
-            return {'filename': os.path.basename(filepath), 'type': 'musical_score'}
+        # For now, extract from filename patterns
+        # Could be enhanced to read actual Finale metadata
+        filename = os.path.basename(filepath)
+        
+        metadata = {'filename': filename, 'type': 'musical_score'}
+        
+        return _match_fields(FINALE_PATTERNS, filename, metadata)
 
     def analyze_file_versions(self, file_paths):
         """Group files by likely project and analyze version progression"""
-        projects = defaultdict(list)
-        
+        # Group by base name (removing version numbers, dates, etc.); a
+        # plain dict keeps projects in first-seen order
+        projects = {}
         for filepath in file_paths:
-            # Group by base name (removing version numbers, dates, etc.)
-            base_name = self._get_project_base_name(filepath)
-            projects[base_name].append(filepath)
+            projects.setdefault(self._get_project_base_name(filepath), []).append(filepath)
         
         version_analysis = {}
         
@@ -131,14 +223,14 @@ class FileEffortAnalyzer:
             files_with_stats = []
             for f in files:
                 try:
-                    stat = os.stat(f)
+                    stat = self._stat_cache.get(f) or os.stat(f)
                     files_with_stats.append({
                         'path': f,
                         'mtime': stat.st_mtime,
                         'size': stat.st_size,
                         'ctime': stat.st_ctime
                     })
-                except:
+                except OSError:
                     continue
             
             files_with_stats.sort(key=lambda x: x['mtime'])
@@ -150,20 +242,8 @@ class FileEffortAnalyzer:
 
     def _get_project_base_name(self, filepath):
         """Extract likely project name from file path"""
-        filename = os.path.basename(filepath)
-        name = os.path.splitext(filename)[0]
-        
-        # Remove common version indicators
-        patterns_to_remove = [
-            r'_v\d+$', r'_version_?\d+$', r'_\d{4}[-_]\d{2}[-_]\d{2}$',
-            r'_copy$', r'_final$', r'_draft$', r'_backup$',
-            r'\s+\(\d+\)$'  # (1), (2), etc from duplicates
-        ]
-        
-        for pattern in patterns_to_remove:
-            name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-        
-        return name.strip()
+        # Copies of a file in other folders share a basename, so cache by it
+        return _project_base_name(os.path.basename(filepath))
 
     def _analyze_work_progression(self, files_with_stats):
         """Analyze work progression through file versions"""
@@ -196,6 +276,10 @@ class FileEffortAnalyzer:
         if len(timestamps) < 2:
             return []
         
+        if np is not None and len(timestamps) >= NUMPY_MIN_TIMESTAMPS:
+            return self._detect_work_sessions_numpy(timestamps)
+        
+        timestamps = sorted(timestamps)
         sessions = []
         current_session_start = timestamps[0]
         current_session_end = timestamps[0]
@@ -228,6 +312,19 @@ class FileEffortAnalyzer:
         
         return sessions
 
+    def _detect_work_sessions_numpy(self, timestamps):
+        """Vectorized _detect_work_sessions: split where the save gap is too long"""
+        ts = np.sort(np.asarray(timestamps, dtype=np.float64))
+        cuts = np.flatnonzero(np.diff(ts) > self.max_session_gap_hours * 3600) + 1
+        starts = ts[np.concatenate(([0], cuts))]
+        ends = ts[np.concatenate((cuts - 1, [ts.size - 1]))]
+        keep = ends - starts >= 300  # 5+ minutes
+        
+        return [
+            {'start': start, 'end': end, 'duration_minutes': (end - start) / 60}
+            for start, end in zip(starts[keep].tolist(), ends[keep].tolist())
+        ]
+
     def _estimate_work_hours(self, sessions, files_with_stats):
         """Estimate actual work hours from sessions and save patterns"""
         if not sessions:
@@ -264,121 +361,120 @@ class FileEffortAnalyzer:
         ext = os.path.splitext(filepath)[1].lower()
         return self.creative_extensions.get(ext, 'document')
 
-    def analyze_single_file(self, filepath):
+    def analyze_single_file(self, filepath, stat=None, ext=None):
         """Analyze a single file for effort indicators"""
         try:
-            stat = os.stat(filepath)
+            stat = stat or self._stat_cache.get(filepath) or os.stat(filepath)
+        except OSError as e:
+            return {'path': filepath, 'error': str(e)}
+        
+        if ext is None:
             ext = os.path.splitext(filepath)[1].lower()
-            file_type = self._guess_file_type(filepath)
-            
-            analysis = {
-                'path': filepath,
-                'filename': os.path.basename(filepath),
-                'file_type': file_type,
-                'extension': ext,
-                'size_kb': round(stat.st_size / 1024, 1),
-                'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                'work_span_days': round((stat.st_mtime - stat.st_ctime) / 86400, 1)
-            }
+        file_type = self.creative_extensions.get(ext, 'document')
+        filename = os.path.basename(filepath)
+        
+        analysis = {
+            'path': filepath,
+            'filename': filename,
+            'file_type': file_type,
+            'extension': ext,
+            'size_kb': round(stat.st_size / 1024, 1),
+            'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+            'work_span_days': round((stat.st_mtime - stat.st_ctime) / 86400, 1)
+        }
+        
+        # Extract specific metadata based on file type; the extractors only
+        # read the basename, so hand them the one already split off
+        if ext in ['.3dj', '.3dz', '.3da', '.prod']:
+            analysis['metadata'] = self.extract_pyware_metadata(filename)
+            analysis['category'] = 'Creative Works'
+            analysis['subcategory'] = 'Drill Design'
             
-            # Extract specific metadata based on file type
-            if ext in ['.3dj', '.3dz', '.3da', '.prod']:
-                analysis['metadata'] = self.extract_pyware_metadata(filepath)
-                analysis['category'] = 'Creative Works'
-                analysis['subcategory'] = 'Drill Design'
-                
-            elif ext in ['.mus', '.musx', '.sib']:
-                analysis['metadata'] = self.extract_finale_metadata(filepath)
-                analysis['category'] = 'Creative Works' 
-                analysis['subcategory'] = 'Musical Composition'
-                
-            elif ext in ['.musicxml', '.mxl']:
-                analysis['category'] = 'Creative Works'
-                analysis['subcategory'] = 'Musical Score'
-                
-            # Estimate effort based on file characteristics
-            analysis['estimated_hours'] = self._estimate_single_file_effort(analysis)
+        elif ext in ['.mus', '.musx', '.sib']:
+            analysis['metadata'] = self.extract_finale_metadata(filename)
+            analysis['category'] = 'Creative Works' 
+            analysis['subcategory'] = 'Musical Composition'
             
-            return analysis
+        elif ext in ['.musicxml', '.mxl']:
+            analysis['category'] = 'Creative Works'
+            analysis['subcategory'] = 'Musical Score'
             
-        except Exception as e:
-            return {'path': filepath, 'error': str(e)}
+        # Estimate effort based on file characteristics
+        analysis['estimated_hours'] = self._estimate_single_file_effort(analysis)
+        
+        return analysis
 
     def _estimate_single_file_effort(self, analysis):
         """Estimate effort for single file based on characteristics"""
-        base_hours = 1.0
-        
-        # Base effort by file type
-        effort_multipliers = {
-            'pyware_project': 8.0,     # Drill design is time-intensive
-            'pyware_compressed': 12.0,  # Finalized shows = even more work
-            'finale_current': 6.0,     # Music composition/arrangement  
-            'finale_legacy': 6.0,
-            'sibelius': 6.0,
-            'musicxml': 2.0,           # Usually exports/imports
-            'document': 2.0,
-            'presentation': 4.0,
-            'spreadsheet': 3.0
-        }
-        
-        base_hours = effort_multipliers.get(analysis['file_type'], 2.0)
-        
-        # Adjust for file size (larger = more complex)
-        size_kb = analysis['size_kb']
-        if size_kb > 5000:      # > 5MB
-            base_hours *= 2.0
-        elif size_kb > 1000:    # > 1MB  
-            base_hours *= 1.5
-        elif size_kb > 500:     # > 500KB
-            base_hours *= 1.2
-        
-        # Adjust for work span (longer span = more iterations)
-        work_span = analysis['work_span_days']
-        if work_span > 30:      # > 1 month of work
-            base_hours *= 1.8
-        elif work_span > 7:     # > 1 week
-            base_hours *= 1.3
-        elif work_span > 1:     # > 1 day
-            base_hours *= 1.1
+        # bisect_left counts the thresholds strictly exceeded
+        base_hours = EFFORT_MULTIPLIERS.get(analysis['file_type'], 2.0)
+        base_hours *= SIZE_MULTIPLIERS[bisect_left(SIZE_KB_THRESHOLDS, analysis['size_kb'])]
+        base_hours *= SPAN_MULTIPLIERS[bisect_left(SPAN_DAY_THRESHOLDS, analysis['work_span_days'])]
         
         return round(base_hours, 1)
 
-    def generate_effort_report(self, file_paths, output_dir):
-        """Generate comprehensive effort analysis report"""
+    def generate_effort_report(self, file_paths, output_dir, jobs=None):
+        """Generate comprehensive effort analysis report
+        
+        jobs sets the number of stat prefetch threads (default DEFAULT_JOBS, 1 = serial).
+        """
         
         print("🔍 Analyzing file effort patterns...")
         
-        # Analyze individual files
-        individual_analyses = []
+        # (path, extension) pairs, so each path is only split once
+        creative_files = []
         for filepath in file_paths:
             ext = os.path.splitext(filepath)[1].lower()
             if ext in self.creative_extensions:
-                analysis = self.analyze_single_file(filepath)
-                if 'error' not in analysis:
-                    individual_analyses.append(analysis)
+                creative_files.append((filepath, ext))
+        
+        # Stat each creative file once for both passes below; the cache
+        # is only written here on the calling thread
+        paths = [filepath for filepath, _ in creative_files]
+        jobs = jobs or DEFAULT_JOBS
+        if jobs == 1:
+            stats = [_stat_or_none(filepath) for filepath in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                stats = list(executor.map(_stat_or_none, paths))
+        for filepath, stat in zip(paths, stats):
+            if stat is not None:
+                self._stat_cache[filepath] = stat
         
-        # Analyze version progressions
-        print("📁 Detecting project versions...")
-        version_analysis = self.analyze_file_versions(file_paths)
+        try:
+            # Analyze individual files; with stats cached this is pure CPU
+            # work, which threads would only slow down under the GIL
+            individual_analyses = [
+                analysis
+                for analysis in (
+                    self.analyze_single_file(filepath, ext=ext)
+                    for filepath, ext in creative_files
+                )
+                if 'error' not in analysis
+            ]
+            
+            # Analyze version progressions
+            print("📁 Detecting project versions...")
+            version_analysis = self.analyze_file_versions(file_paths)
+        finally:
+            self._stat_cache.clear()
         
         # Generate summary statistics
         summary = self._generate_effort_summary(individual_analyses, version_analysis)
         
         # Write detailed reports
-        os.makedirs(output_dir, exist_ok=True)
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
         
         # Individual file analysis
-        with open(os.path.join(output_dir, 'file_effort_analysis.json'), 'w') as f:
-            json.dump(individual_analyses, f, indent=2)
+        (output_dir / 'file_effort_analysis.json').write_bytes(_dumps(individual_analyses))
         
-        # Project version analysis  
-        with open(os.path.join(output_dir, 'project_analysis.json'), 'w') as f:
-            json.dump(version_analysis, f, indent=2)
+        # Project version analysis
+        (output_dir / 'project_analysis.json').write_bytes(_dumps(version_analysis))
         
         # Summary report
-        with open(os.path.join(output_dir, 'effort_summary.json'), 'w') as f:
-            json.dump(summary, f, indent=2)
+        (output_dir / 'effort_summary.json').write_bytes(_dumps(summary))
         
         return summary
 
@@ -386,21 +482,31 @@ class FileEffortAnalyzer:
         """Generate summary of effort analysis"""
         
         total_files = len(individual_analyses)
-        total_estimated_hours = sum(f.get('estimated_hours', 0) for f in individual_analyses)
+        total_estimated_hours = 0
         
-        # Group by file type
-        by_type = defaultdict(list)
+        # Accumulate per-type totals in one pass, one dict lookup per file
+        by_type = {}
         for analysis in individual_analyses:
-            by_type[analysis['file_type']].append(analysis)
+            hours = analysis.get('estimated_hours', 0)
+            total_estimated_hours += hours
+            
+            totals = by_type.get(analysis['file_type'])
+            if totals is None:
+                totals = by_type[analysis['file_type']] = {'count': 0, 'hours': 0, 'size_kb': 0, 'files': []}
+            totals['count'] += 1
+            totals['hours'] += hours
+            totals['size_kb'] += analysis.get('size_kb', 0)
+            if len(totals['files']) < 5:
+                totals['files'].append(analysis['filename'])  # Sample filenames
         
         type_summaries = {}
-        for file_type, files in by_type.items():
+        for file_type, totals in by_type.items():
             type_summaries[file_type] = {
-                'count': len(files),
-                'total_hours': sum(f.get('estimated_hours', 0) for f in files),
-                'avg_hours_per_file': round(sum(f.get('estimated_hours', 0) for f in files) / len(files), 1) if files else 0,
-                'total_size_mb': round(sum(f.get('size_kb', 0) for f in files) / 1024, 1),
-                'files': [f['filename'] for f in files[:5]]  # Sample filenames
+                'count': totals['count'],
+                'total_hours': totals['hours'],
+                'avg_hours_per_file': round(totals['hours'] / totals['count'], 1),
+                'total_size_mb': round(totals['size_kb'] / 1024, 1),
+                'files': totals['files']
             }
         
         # Project analysis summary
@@ -417,14 +523,14 @@ class FileEffortAnalyzer:
             'total_estimated_hours': round(total_estimated_hours, 1),
             'by_file_type': type_summaries,
             'project_analysis': project_summary,
-            'top_time_investments': sorted([
+            'top_time_investments': heapq.nlargest(10, (
                 {'name': name, 'hours': data.get('estimated_hours', 0), 'files': data.get('file_count', 1)}
                 for name, data in version_analysis.items()
-            ], key=lambda x: x['hours'], reverse=True)[:10]
+            ), key=lambda x: x['hours'])
         }
 
 # Integration function to add to your existing scan.py
-def analyze_creative_files_effort(rows, output_dir):
+def analyze_creative_files_effort(rows, output_dir, jobs=None):
     """Analyze effort for creative files found in evidence scan"""
     
     analyzer = FileEffortAnalyzer()
@@ -445,7 +551,7 @@ def analyze_creative_files_effort(rows, output_dir):
     print(f"Found {len(creative_files)} creative files for effort analysis...")
     
     # Run effort analysis
-    summary = analyzer.generate_effort_report(creative_files, output_dir)
+    summary = analyzer.generate_effort_report(creative_files, output_dir, jobs=jobs)
     
     print(f"📊 Creative Work Effort Summary:")
     print(f"   Total files: {summary['total_files_analyzed']}")
@@ -3,16 +3,24 @@
 
 from __future__ import annotations
 
+import codecs
+import itertools
+import locale
+import os
+import queue
+import re
 import shlex
 import subprocess
 import sys
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from tkinter import font as tkfont
 from tkinter import ttk
 from tkinter.scrolledtext import ScrolledText
 
@@ -21,6 +29,34 @@ class EvidenceFinderApp:
     """High-level controller for the desktop GUI."""
 
     YEAR_CHOICES = (2021, 2022, 2023, 2024, 2025)
+    MODE_DESCRIPTIONS = {
+        "pass1": "Quick metadata review",
+        "pass2": "Full text extraction",
+        "full": "Complete scan",
+    }
+
+    COLOR_BACKGROUND = "#f5f7fb"
+    COLOR_TEXT = "#1a2b49"
+    COLOR_TEXT_MUTED = "#51617d"
+    FONT_CANDIDATES = ("Segoe UI", "SF Pro Text", "Helvetica Neue", "Helvetica", "Arial")
+    # Shared grid placement for the mode radio buttons and year checkboxes.
+    OPTION_GRID = {"row": 0, "padx": (8, 16), "pady": 12, "sticky": "w"}
+
+    UI_STATES = {
+        "idle": {"scan_button": {"state": "normal"}, "stop_button": {"state": "disabled"}},
+        "scanning": {"scan_button": {"state": "disabled"}, "stop_button": {"state": "normal"}},
+    }
+
+    MAX_LOG_LINES = 2000
+    DRAIN_INTERVAL_MS = 50
+    SCAN_PIPE_SIZE = 1 << 20
+    SCAN_READ_CHUNK = 1 << 16
+    # Universal newlines only ("\r\n", "\r", "\n"); str.splitlines would
+    # also break on "\f", "\v", "\x85", "\u2028" and friends.
+    LINE_BREAK_RE = re.compile(r"(?<=\n)|(?<=\r)(?!\n)")
+
+    STATUS_READY = "Status: Ready"
+    STATUS_PREPARING = "Status: Preparing scan…"
 
     def __init__(self) -> None:
         self.root = tk.Tk()
@@ -33,21 +69,54 @@ class EvidenceFinderApp:
         self.results_dir = self.working_dir / "results"
         self.working_dir.mkdir(parents=True, exist_ok=True)
         self.results_dir.mkdir(parents=True, exist_ok=True)
+        self._mode_commands = self._build_mode_commands()
+        self._results_arg = str(self.results_dir.relative_to(self.working_dir))
 
-        self.current_scan_process: subprocess.Popen[str] | None = None
+        self.current_scan_process: subprocess.Popen[bytes] | None = None
         self.scan_thread: threading.Thread | None = None
         self.scanning = False
         self.scan_started_at: float | None = None
 
         self.mode_var = tk.StringVar(value="pass1")
         self.year_vars: dict[int, tk.BooleanVar] = {}
+        # Kept in sync by a write trace on each year variable.
+        self.selected_years: set[int] = set()
         self.selected_directories: List[str] = []
 
-        self.status_var = tk.StringVar(value="Status: Ready")
+        self.status_var = tk.StringVar(value=self.STATUS_READY)
+        # Status text is only set from the Tk thread, so no lock.
+        self._pending_status = self.STATUS_READY
+        self._status_dirty = False
+
+        # Log lines are buffered and flushed to the status widget in one idle
+        # callback so bursts of scan output cost a single insert. Only the Tk
+        # thread logs (scan output arrives through _line_q), so no lock.
+        # Bounded to the widget's capacity: lines that would be trimmed on the
+        # next flush anyway are dropped before they are ever inserted.
+        self._log_buffer: deque[tuple[str, str]] = deque(maxlen=self.MAX_LOG_LINES)
+        self._log_visible = True
+        self._log_flush_scheduled = False
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
+        self._log_line_count = 0
+
+        # Scan output is read on the worker thread and handed to the Tk thread
+        # through this queue, which _drain_scan_output empties on a timer. The
+        # worker never touches Tk itself. A non-str item marks the end of the
+        # scan: the scanner's return code, or None if it failed to start. Each
+        # scan gets a fresh queue so a stopped scan's late output is discarded.
+        # Each tick drains everything queued, so the queue holds at most one
+        # tick of output and _log_buffer's maxlen drops what the widget
+        # would trim anyway.
+        self._line_q: queue.Queue[str | int | None] = queue.Queue()
+        self._drain_after_id: str | None = None
+        self._elapsed_after_id: str | None = None
 
         self._configure_styles()
         self._build_layout()
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<Unmap>", lambda event: self._on_root_visibility(event, False))
+        self.root.bind("<Map>", lambda event: self._on_root_visibility(event, True))
 
     # ------------------------------------------------------------------
     # Initialisation helpers
@@ -55,7 +124,7 @@ class EvidenceFinderApp:
         if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
             runtime_root = Path(getattr(sys, "_MEIPASS"))  # type: ignore[attr-defined]
             bundled_scripts = runtime_root / "embedded_scripts"
-            if bundled_scripts.exists():
+            if bundled_scripts.is_dir():
                 return bundled_scripts
         return Path(__file__).resolve().parent
 
@@ -64,6 +133,24 @@ class EvidenceFinderApp:
             return Path.home() / "AcademicEvidenceFinder"
         return Path(__file__).resolve().parents[1]
 
+    def _build_mode_commands(self) -> dict[str, List[str]]:
+        """Resolve the scanner command prefix for each mode once at startup."""
+        script_dir = self.runtime_scripts_dir
+        optimized_script = script_dir / "scan_optimized.py"
+        legacy_script = str(script_dir / "scan.py")
+        primary_script = str(optimized_script) if optimized_script.is_file() else legacy_script
+
+        return {
+            "pass1": [sys.executable, primary_script, "--pass1-only"],
+            "pass2": [sys.executable, primary_script],
+            "full": [sys.executable, legacy_script],
+        }
+
+    def _resolve_font_family(self) -> str:
+        """Return the first installed family from FONT_CANDIDATES."""
+        available = frozenset(tkfont.families(self.root))
+        return next((family for family in self.FONT_CANDIDATES if family in available), "Helvetica")
+
     def _configure_styles(self) -> None:
         style = ttk.Style()
         try:
@@ -71,13 +158,14 @@ class EvidenceFinderApp:
         except tk.TclError:
             pass
 
-        style.configure("App.TFrame", background="#f5f7fb")
-        style.configure("Section.TLabelframe", background="#f5f7fb", font=("Segoe UI", 11, "bold"))
-        style.configure("Section.TLabelframe.Label", foreground="#1a2b49")
-        style.configure("Heading.TLabel", background="#f5f7fb", foreground="#1a2b49", font=("Segoe UI", 20, "bold"))
-        style.configure("Subheading.TLabel", background="#f5f7fb", foreground="#51617d", font=("Segoe UI", 11))
-        style.configure("Status.TLabel", background="#f5f7fb", foreground="#1a2b49", font=("Segoe UI", 10))
-        style.configure("Accent.TButton", font=("Segoe UI", 11, "bold"))
+        family = self._resolve_font_family()
+        style.configure("App.TFrame", background=self.COLOR_BACKGROUND)
+        style.configure("Section.TLabelframe", background=self.COLOR_BACKGROUND, font=(family, 11, "bold"))
+        style.configure("Section.TLabelframe.Label", foreground=self.COLOR_TEXT)
+        style.configure("Heading.TLabel", background=self.COLOR_BACKGROUND, foreground=self.COLOR_TEXT, font=(family, 20, "bold"))
+        style.configure("Subheading.TLabel", background=self.COLOR_BACKGROUND, foreground=self.COLOR_TEXT_MUTED, font=(family, 11))
+        style.configure("Status.TLabel", background=self.COLOR_BACKGROUND, foreground=self.COLOR_TEXT, font=(family, 10))
+        style.configure("Accent.TButton", font=(family, 11, "bold"))
 
     # ------------------------------------------------------------------
     # Layout
@@ -108,12 +196,7 @@ class EvidenceFinderApp:
         frame = ttk.Labelframe(parent, text="Scan mode", style="Section.TLabelframe")
         frame.pack(fill="x", pady=(0, 12))
 
-        descriptions = {
-            "pass1": "Quick metadata review",
-            "pass2": "Full text extraction",
-            "full": "Complete scan",
-        }
-        for idx, (value, label) in enumerate(descriptions.items()):
+        for idx, (value, label) in enumerate(self.MODE_DESCRIPTIONS.items()):
             rb = ttk.Radiobutton(
                 frame,
                 text=label,
@@ -121,17 +204,21 @@ class EvidenceFinderApp:
                 variable=self.mode_var,
                 command=lambda mode=value: self._log(f"Mode set to: {mode}"),
             )
-            rb.grid(row=0, column=idx, padx=(8, 16), pady=12, sticky="w")
+            rb.grid(column=idx, **self.OPTION_GRID)
 
     def _build_year_panel(self, parent: ttk.Frame) -> None:
         frame = ttk.Labelframe(parent, text="Target years", style="Section.TLabelframe")
         frame.pack(fill="x", pady=(0, 12))
 
         for idx, year in enumerate(self.YEAR_CHOICES):
-            var = tk.BooleanVar(value=year >= 2024)
+            selected = year >= 2024
+            var = tk.BooleanVar(value=selected)
             self.year_vars[year] = var
-            cb = ttk.Checkbutton(frame, text=str(year), variable=var, command=self._update_year_log)
-            cb.grid(row=0, column=idx, padx=(8, 16), pady=12, sticky="w")
+            if selected:
+                self.selected_years.add(year)
+            var.trace_add("write", lambda *_args, year=year, var=var: self._on_year_toggled(year, var))
+            cb = ttk.Checkbutton(frame, text=str(year), variable=var)
+            cb.grid(column=idx, **self.OPTION_GRID)
 
     def _build_directory_panel(self, parent: ttk.Frame) -> None:
         frame = ttk.Labelframe(parent, text="Directories", style="Section.TLabelframe")
@@ -171,6 +258,10 @@ class EvidenceFinderApp:
 
         self.status_text = ScrolledText(frame, wrap="word", height=18)
         self.status_text.pack(fill="both", expand=True, padx=12, pady=12)
+        # Right gravity keeps the mark after each insert, so it always tracks
+        # the tail of the log without re-resolving the "end" index.
+        self.status_text.mark_set("log_end", "end-1c")
+        self.status_text.mark_gravity("log_end", "right")
         self.status_text.configure(state="disabled")
 
         progress_row = ttk.Frame(frame)
@@ -194,32 +285,77 @@ class EvidenceFinderApp:
         selection = list(self.dir_listbox.curselection())
         if not selection:
             return
+        # Listbox rows mirror selected_directories index-for-index, so rows can
+        # be dropped by position without reading back the displayed text.
         for index in reversed(selection):
-            directory = self.dir_listbox.get(index)
+            directory = self.selected_directories.pop(index)
             self.dir_listbox.delete(index)
-            if directory in self.selected_directories:
-                self.selected_directories.remove(directory)
-                self._log(f"Removed directory: {directory}")
+            self._log(f"Removed directory: {directory}")
+
+    def _on_year_toggled(self, year: int, var: tk.BooleanVar) -> None:
+        if var.get():
+            self.selected_years.add(year)
+        else:
+            self.selected_years.discard(year)
+        self._update_year_log()
 
     def _update_year_log(self) -> None:
-        years = [str(year) for year, var in self.year_vars.items() if var.get()]
+        years = [str(year) for year in sorted(self.selected_years)]
         self._log(f"Target years: {', '.join(years) if years else 'None'}")
 
     # ------------------------------------------------------------------
     # Logging helpers
     def _log(self, message: str) -> None:
-        timestamp = time.strftime("%H:%M:%S")
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self._log_buffer.append((self._last_ts_str, message))
+        if self._log_flush_scheduled:
+            return
+        self._log_flush_scheduled = True
+        self.root.after_idle(self._flush_log)
 
-        def append() -> None:
-            self.status_text.configure(state="normal")
-            self.status_text.insert("end", f"[{timestamp}] {message}\n")
-            self.status_text.see("end")
-            self.status_text.configure(state="disabled")
+    def _flush_log(self) -> None:
+        if not self._log_visible:
+            # Leave the flush flag set so _log stops scheduling callbacks; the
+            # <Map> handler flushes everything once the window is shown again.
+            return
+        entries = list(self._log_buffer)
+        self._log_buffer.clear()
+        self._log_flush_scheduled = False
+        if not entries:
+            return
+        pending = "".join(f"[{timestamp}] {message}\n" for timestamp, message in entries)
+        self.status_text.configure(state="normal")
+        self.status_text.insert("log_end", pending)
+        self._log_line_count += pending.count("\n")
+        excess = self._log_line_count - self.MAX_LOG_LINES
+        if excess > 0:
+            self.status_text.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = self.MAX_LOG_LINES
+        self.status_text.yview_moveto(1.0)
+        self.status_text.configure(state="disabled")
 
-        self.root.after(0, append)
+    def _on_root_visibility(self, event: tk.Event, visible: bool) -> None:
+        if event.widget is not self.root:
+            return
+        self._log_visible = visible
+        if visible:
+            self._flush_log()
 
     def _set_status(self, text: str) -> None:
-        self.root.after(0, lambda: self.status_var.set(text))
+        # Only the latest text matters, so repeated calls before Tk gets round
+        # to the flush collapse into a single status_var update.
+        self._pending_status = text
+        if self._status_dirty:
+            return
+        self._status_dirty = True
+        self.root.after_idle(self._flush_status)
+
+    def _flush_status(self) -> None:
+        self._status_dirty = False
+        self.status_var.set(self._pending_status)
 
     # ------------------------------------------------------------------
     # Scan execution
@@ -232,7 +368,7 @@ class EvidenceFinderApp:
             messagebox.showinfo("Select folders", "Add at least one folder to scan before starting.")
             return
 
-        years = [year for year, var in self.year_vars.items() if var.get()]
+        years = sorted(self.selected_years)
         if not years:
             messagebox.showinfo("Select years", "Choose at least one target year.")
             return
@@ -241,85 +377,181 @@ class EvidenceFinderApp:
 
         self.scanning = True
         self.scan_started_at = time.time()
-        self.scan_button.configure(state="disabled")
-        self.stop_button.configure(state="normal")
-        self.progress_bar.start(12)
-        self._set_status("Status: Preparing scan…")
+        self._line_q = queue.Queue()
+        self._apply_ui_state("scanning")
+        self._set_status(self.STATUS_PREPARING)
         self._log("Starting scan…")
 
         self.scan_thread = threading.Thread(
             target=self._run_scan,
-            args=(mode, years, directories),
+            args=(mode, years, directories, self._line_q),
             daemon=True,
         )
         self.scan_thread.start()
+        if self._drain_after_id is None:
+            self._drain_after_id = self.root.after(self.DRAIN_INTERVAL_MS, self._drain_scan_output)
+        self._cancel_elapsed_updates()
         self._schedule_elapsed_updates()
 
     def _schedule_elapsed_updates(self) -> None:
+        self._elapsed_after_id = None
         if not self.scanning or self.scan_started_at is None:
             return
         elapsed = int(time.time() - self.scan_started_at)
         self._set_status(f"Status: Scanning… ({elapsed}s elapsed)")
-        self.root.after(1000, self._schedule_elapsed_updates)
-
-    def _run_scan(self, mode: str, years: Iterable[int], directories: Iterable[str]) -> None:
+        self._elapsed_after_id = self.root.after(1000, self._schedule_elapsed_updates)
+
+    def _cancel_elapsed_updates(self) -> None:
+        # A stop followed by a quick restart would otherwise leave the previous
+        # scan's timer running alongside the new one.
+        if self._elapsed_after_id is not None:
+            self.root.after_cancel(self._elapsed_after_id)
+            self._elapsed_after_id = None
+
+    def _drain_scan_output(self) -> None:
+        """Move all queued scan output into the log in one batch per tick."""
+        self._drain_after_id = None
+        # Snapshot the size so a scanner that outpaces the drain cannot keep
+        # this loop running forever; anything newer waits for the next tick.
+        for _ in range(self._line_q.qsize()):
+            try:
+                item = self._line_q.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                self._log(item)
+            else:
+                self._handle_scan_exit(item)
+        self._flush_log()
+
+        if self.scanning or not self._line_q.empty():
+            self._drain_after_id = self.root.after(self.DRAIN_INTERVAL_MS, self._drain_scan_output)
+
+    def _run_scan(
+        self,
+        mode: str,
+        years: Iterable[int],
+        directories: Iterable[str],
+        line_q: queue.Queue[str | int | None],
+    ) -> None:
         year_start = f"{min(years)}-01-01"
         year_end = f"{max(years)}-12-31"
 
-        script_dir = self.runtime_scripts_dir
-        optimized_script = script_dir / "scan_optimized.py"
-        legacy_script = script_dir / "scan.py"
-
-        if mode == "pass1":
-            base_cmd = [sys.executable, str(optimized_script if optimized_script.exists() else legacy_script), "--pass1-only"]
-        elif mode == "pass2":
-            base_cmd = [sys.executable, str(optimized_script if optimized_script.exists() else legacy_script)]
-        else:
-            base_cmd = [sys.executable, str(legacy_script)]
-
+        base_cmd = self._mode_commands.get(mode, self._mode_commands["full"])
         cmd = base_cmd + [
             "--modified-since",
             year_start,
             "--modified-until",
             year_end,
             "--out",
-            str(self.results_dir.relative_to(self.working_dir)),
+            self._results_arg,
         ]
 
-        for directory in directories:
-            cmd.extend(["--include", directory])
+        cmd.extend(itertools.chain.from_iterable(("--include", directory) for directory in directories))
 
         quoted = " ".join(shlex.quote(part) for part in cmd)
-        self._log(f"Executing: {quoted}")
+        line_q.put(f"Executing: {quoted}")
 
+        # A wider pipe keeps verbose scanners from blocking on a full 64 KiB
+        # buffer while the GUI catches up.
+        popen_kwargs = {"pipesize": self.SCAN_PIPE_SIZE} if sys.version_info >= (3, 10) else {}
         try:
-            self.current_scan_process = subprocess.Popen(
+            process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
                 cwd=self.working_dir,
-                bufsize=1,
+                bufsize=-1,
+                **popen_kwargs,
             )
         except Exception as exc:  # pragma: no cover - defensive UI feedback
-            self._log(f"Unable to start scan: {exc}")
-            self._finish_scan()
+            line_q.put(f"Unable to start scan: {exc}")
+            line_q.put(None)
             return
+        # Work with the local handle from here on: stop_scan/_finish_scan may
+        # already have cleared current_scan_process.
+        self.current_scan_process = process
+        assert process.stdout is not None
 
-        assert self.current_scan_process.stdout is not None
-
-        for line in self.current_scan_process.stdout:
-            if not line:
-                continue
-            self._log(line.rstrip())
-
-        return_code = self.current_scan_process.wait()
+        reached_eof = False
+        try:
+            if not popen_kwargs:
+                self._widen_pipe(process.stdout.fileno())
+            # Stop may have been pressed before Popen returned.
+            if self.scanning:
+                for line in self._iter_output_lines(process.stdout.fileno()):
+                    if not self.scanning:
+                        break
+                    line_q.put(line)
+                else:
+                    reached_eof = True
+        finally:
+            return_code = None
+            try:
+                if not reached_eof and process.poll() is None:
+                    # Stopped or the reader failed: nothing drains the pipe any
+                    # more, so end the scanner instead of waiting on it.
+                    process.terminate()
+                    try:
+                        process.wait(timeout=5)
+                    except subprocess.TimeoutExpired:
+                        process.kill()
+                return_code = process.wait()
+            finally:
+                process.stdout.close()
+                # Always queued, after the final output line, so the Tk thread
+                # sees EOF and the exit status in order and stops polling.
+                line_q.put(return_code)
+
+    def _handle_scan_exit(self, return_code: int | None) -> None:
+        if not self.scanning:
+            # stop_scan already terminated the process and reset the UI.
+            return
+        # None means the scanner never started; _run_scan queued the reason.
         if return_code == 0:
             self._log("Scan completed successfully.")
-        else:
+        elif return_code is not None:
             self._log(f"Scan exited with code {return_code}.")
         self._finish_scan()
 
+    def _iter_output_lines(self, fd: int) -> Iterator[str]:
+        """Yield decoded lines from a pipe, reading it in large chunks.
+
+        Matches the previous text-mode behaviour: locale encoding and universal
+        newlines, so carriage-return progress updates become separate lines.
+        """
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        pending = ""
+        while True:
+            chunk = os.read(fd, self.SCAN_READ_CHUNK)
+            pending += decoder.decode(chunk, final=not chunk)
+            lines = self.LINE_BREAK_RE.split(pending)
+            # Hold back an unterminated tail, and a trailing "\r" that may be
+            # the first half of a "\r\n" split across reads.
+            pending = lines.pop()
+            if chunk and not pending and lines and lines[-1].endswith("\r"):
+                pending = lines.pop()
+            if not chunk and pending:
+                lines.append(pending)
+            for line in lines:
+                yield line.rstrip()
+            if not chunk:
+                return
+
+    def _widen_pipe(self, fd: int) -> None:
+        """Grow a pipe buffer on Linux when Popen(pipesize=...) is unavailable."""
+        try:
+            import fcntl
+        except ImportError:  # pragma: no cover - non-POSIX platforms
+            return
+        set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", 1031 if sys.platform.startswith("linux") else None)
+        if set_pipe_size is None:
+            return
+        try:
+            fcntl.fcntl(fd, set_pipe_size, self.SCAN_PIPE_SIZE)
+        except OSError:
+            pass
+
     def stop_scan(self) -> None:
         if not self.scanning:
             return
@@ -336,10 +568,17 @@ class EvidenceFinderApp:
         self.scanning = False
         self.current_scan_process = None
         self.scan_thread = None
-        self.root.after(0, self.progress_bar.stop)
-        self.root.after(0, lambda: self.scan_button.configure(state="normal"))
-        self.root.after(0, lambda: self.stop_button.configure(state="disabled"))
-        self._set_status("Status: Ready")
+        self._apply_ui_state("idle")
+        self._set_status(self.STATUS_READY)
+
+    def _apply_ui_state(self, state: str) -> None:
+        """Reconfigure the scan controls for ``state`` in a single Tk callback."""
+        for widget_name, options in self.UI_STATES[state].items():
+            getattr(self, widget_name).configure(**options)
+        if state == "scanning":
+            self.progress_bar.start(12)
+        else:
+            self.progress_bar.stop()
 
     # ------------------------------------------------------------------
     def _on_close(self) -> None:
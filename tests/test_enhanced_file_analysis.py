@@ -0,0 +1,115 @@
+"""Tests for the creative-file effort analyzer script."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from enhanced_file_analysis import FileEffortAnalyzer
+
+
+def make_file(directory: Path, name: str, mtime: float, size: int = 100) -> str:
+    path = directory / name
+    with path.open("wb") as handle:
+        handle.truncate(size)
+    os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+def test_analyze_file_versions_keeps_first_seen_project_order(tmp_path):
+    base = 1_700_000_000
+    paths = [
+        make_file(tmp_path, "Zulu_v1.musx", base),
+        make_file(tmp_path, "Alpha_v1.musx", base + 10),
+        make_file(tmp_path, "Zulu_v2.musx", base + 20),
+        make_file(tmp_path, "Mike_v1.3dj", base + 30),
+        make_file(tmp_path, "Alpha_v2.musx", base + 40),
+        make_file(tmp_path, "Mike_v2.3dj", base + 50),
+    ]
+
+    versions = FileEffortAnalyzer().analyze_file_versions(paths)
+
+    assert list(versions) == ["Zulu", "Alpha", "Mike"]
+    assert versions["Zulu"]["files"] == [paths[0], paths[2]]
+
+
+def test_top_time_investments_keep_project_order_on_ties():
+    version_analysis = {
+        "My_Composition": {"estimated_hours": 0, "file_count": 3},
+        "Show_Animation": {"estimated_hours": 2.5, "file_count": 2},
+        "Drill_Design_2024": {"estimated_hours": 0, "file_count": 2},
+        "Ballad": {"estimated_hours": 2.5, "file_count": 4},
+    }
+
+    summary = FileEffortAnalyzer()._generate_effort_summary([], version_analysis)
+
+    names = [entry["name"] for entry in summary["top_time_investments"]]
+    assert names == ["Show_Animation", "Ballad", "My_Composition", "Drill_Design_2024"]
+
+
+def test_metadata_for_non_ascii_filenames_matches_case_insensitive_search():
+    analyzer = FileEffortAnalyzer()
+
+    assert analyzer.extract_pyware_metadata("/shows/iſhow8A.3dj") == {
+        "filename": "iſhow8A.3dj",
+        "type": "drill_design",
+        "show_name": "iſhow",
+    }
+    assert analyzer.extract_finale_metadata("İstanbul v2 score.mus") == {
+        "filename": "İstanbul v2 score.mus",
+        "type": "musical_score",
+        "piece_title": "İstanbul v",
+        "version": "v2",
+        "instrument": "score",
+    }
+    assert analyzer.extract_pyware_metadata("Kırşehir Mvmt 2_V3.3dj")["show_name"] == "ehir Mvmt "
+    assert analyzer.extract_finale_metadata("Straße Piano Version 2.sib")["instrument"] == "Piano"
+
+
+def test_numpy_session_detection_matches_loop(monkeypatch):
+    pytest.importorskip("numpy")
+    import enhanced_file_analysis
+
+    hour = 3600
+    timestamps = [
+        0, 150, 300,                    # exactly the 5 minute minimum: kept
+        300 + 4 * hour,                 # gap exactly at the limit: same session
+        300 + 8 * hour + 1,             # just over the limit: new session
+        300 + 8 * hour + 300,           # 299 s session: dropped
+        300 + 13 * hour,
+        300 + 15 * hour,
+    ]
+    timestamps = timestamps + [t + 30 * hour for t in timestamps]
+    analyzer = FileEffortAnalyzer()
+
+    monkeypatch.setattr(enhanced_file_analysis, "NUMPY_MIN_TIMESTAMPS", 10**9)
+    loop_sessions = analyzer._detect_work_sessions(list(reversed(timestamps)))
+    monkeypatch.setattr(enhanced_file_analysis, "NUMPY_MIN_TIMESTAMPS", 2)
+    numpy_sessions = analyzer._detect_work_sessions(list(reversed(timestamps)))
+
+    assert numpy_sessions == loop_sessions
+    assert [(s["start"], s["end"]) for s in loop_sessions] == [
+        (0, 300 + 4 * hour),
+        (300 + 13 * hour, 300 + 15 * hour),
+        (30 * hour, 300 + 34 * hour),
+        (300 + 43 * hour, 300 + 45 * hour),
+    ]
+
+
+def test_generate_effort_report_serial_jobs_skips_thread_pool(tmp_path, monkeypatch):
+    import enhanced_file_analysis
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("jobs=1 must not start a thread pool")
+
+    monkeypatch.setattr(enhanced_file_analysis, "ThreadPoolExecutor", no_pool)
+    paths = [
+        make_file(tmp_path, "Opener_v1.musx", 1_700_000_000),
+        make_file(tmp_path, "Opener_v2.musx", 1_700_000_600),
+        str(tmp_path / "missing.musx"),
+    ]
+
+    summary = FileEffortAnalyzer().generate_effort_report(paths, tmp_path / "out", jobs=1)
+
+    assert summary["total_files_analyzed"] == 2
+    assert summary["project_analysis"]["total_projects"] == 1
@@ -0,0 +1,103 @@
+"""Tests for the desktop app's scan worker, run without a Tk window."""
+
+import locale
+import os
+import queue
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from evidence_finder_app import EvidenceFinderApp
+
+
+def make_worker(tmp_path, script: str, scanning: bool) -> EvidenceFinderApp:
+    # Skip __init__ so no Tk root is created; _run_scan only needs these.
+    app = object.__new__(EvidenceFinderApp)
+    app._mode_commands = {"full": [sys.executable, "-c", script]}
+    app._results_arg = "results"
+    app.working_dir = tmp_path
+    app.scanning = scanning
+    app.current_scan_process = None
+    return app
+
+
+def run_worker(app: EvidenceFinderApp) -> list:
+    line_q: queue.Queue = queue.Queue()
+    worker = threading.Thread(target=app._run_scan, args=("full", [2024], [], line_q), daemon=True)
+    worker.start()
+    worker.join(timeout=15)
+    assert not worker.is_alive(), "scan worker hung"
+    items = []
+    while not line_q.empty():
+        items.append(line_q.get_nowait())
+    return items
+
+
+def test_run_scan_queues_output_then_exit_code(tmp_path):
+    app = make_worker(tmp_path, "print('one'); print('two'); raise SystemExit(3)", scanning=True)
+
+    items = run_worker(app)
+
+    assert items[0].startswith("Executing: ")
+    assert items[1:] == ["one", "two", 3]
+
+
+def test_run_scan_stopped_before_popen_terminates_scanner(tmp_path):
+    flood = "import sys\nwhile True:\n    sys.stdout.write('x' * 1000 + '\\n')\n"
+    app = make_worker(tmp_path, flood, scanning=False)
+
+    items = run_worker(app)
+
+    assert app.current_scan_process.poll() is not None
+    assert not isinstance(items[-1], str)
+    assert items[-1] != 0
+
+
+def test_run_scan_queues_exit_sentinel_when_reader_fails(tmp_path, monkeypatch):
+    app = make_worker(tmp_path, "import time; print('x'); time.sleep(30)", scanning=True)
+
+    def broken_reader(fd):
+        raise OSError("read failed")
+        yield  # pragma: no cover - makes this a generator
+
+    monkeypatch.setattr(app, "_iter_output_lines", broken_reader)
+    monkeypatch.setattr(threading, "excepthook", lambda args: None)
+
+    items = run_worker(app)
+
+    assert app.current_scan_process.poll() is not None
+    assert not isinstance(items[-1], str)
+
+
+def read_lines(monkeypatch, data: bytes, chunk: int) -> list:
+    app = object.__new__(EvidenceFinderApp)
+    monkeypatch.setattr(app, "SCAN_READ_CHUNK", chunk, raising=False)
+    monkeypatch.setattr(locale, "getpreferredencoding", lambda do_setlocale=True: "utf-8")
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data)
+    os.close(write_fd)
+    try:
+        return list(app._iter_output_lines(read_fd))
+    finally:
+        os.close(read_fd)
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 3, 7, 1 << 16])
+def test_iter_output_lines_handles_chunk_boundaries(monkeypatch, chunk):
+    data = "héllo\r\nwörld\nprog 1\rprog 2\r\n\r\n€ end\r".encode("utf-8")
+
+    lines = read_lines(monkeypatch, data, chunk)
+
+    assert lines == ["héllo", "wörld", "prog 1", "prog 2", "", "€ end"]
+
+
+@pytest.mark.parametrize("chunk", [1, 3, 1 << 16])
+def test_iter_output_lines_splits_on_universal_newlines_only(monkeypatch, chunk):
+    data = b"x\x0cy\nform\x0bfeed\x1cz\r\rtail"
+
+    lines = read_lines(monkeypatch, data, chunk)
+
+    assert lines == ["x\x0cy", "form\x0bfeed\x1cz", "", "tail"]